@@ -1,22 +1,24 @@
+import sys
+
 def depositar(saldo, extrato, valor):
     """
     Realiza a operação de depósito.
-    Recebe saldo e extrato e retorna os novos valores.
+    Recebe saldo e extrato (lista, alterada no próprio lugar) e retorna o novo saldo.
     """
     if valor > 0:
         saldo += valor
-        extrato += f"Depósito: R$ {valor:.2f}\n"
+        extrato.append(f"Depósito: R$ {valor:.2f}")
         print("Depósito realizado com sucesso!")
     else:
         print("Operação falhou! O valor informado é inválido.")
     
-    # Retorna o saldo e extrato atualizados
-    return saldo, extrato
+    # Retorna o saldo atualizado (o extrato é alterado no próprio lugar)
+    return saldo
 
 def sacar(saldo, extrato, numero_saques, valor, limite, limite_saques):
     """
     Realiza a operação de saque, verificando limites.
-    Recebe todos os dados e retorna os novos valores.
+    Recebe todos os dados e retorna o novo saldo e número de saques.
     """
     excedeu_saldo = valor > saldo
     excedeu_limite = valor > limite
@@ -30,23 +32,25 @@ def sacar(saldo, extrato, numero_saques, valor, limite, limite_saques):
         print(f"Operação falhou! Número máximo de {limite_saques} saques excedido.")
     elif valor > 0:
         saldo -= valor
-        extrato += f"Saque: R$ {valor:.2f}\n"
+        extrato.append(f"Saque: R$ {valor:.2f}")
         numero_saques += 1
         print("Saque realizado com sucesso!")
     else:
         print("Operação falhou! O valor informado é inválido.")
         
-    # Retorna o saldo, extrato e número de saques atualizados
-    return saldo, extrato, numero_saques
+    # Retorna o saldo e número de saques atualizados
+    return saldo, numero_saques
 
 def exibir_extrato(saldo, extrato):
     """
     Exibe o extrato e o saldo atual.
     """
-    print("\n================ EXTRATO ================")
-    print("Não foram realizadas movimentações." if not extrato else extrato)
-    print(f"\nSaldo Atual: R$ {saldo:.2f}")
-    print("==========================================")
+    sys.stdout.write(
+        "\n================ EXTRATO ================\n"
+        + ("\n".join(extrato) + "\n" if extrato else "Não foram realizadas movimentações.")
+        + f"\n\nSaldo Atual: R$ {saldo:.2f}\n"
+        + "==========================================\n"
+    )
     
 # --- Configurações Iniciais ---
 menu = """
@@ -60,7 +64,7 @@ menu = """
 
 saldo = 0
 limite = 500
-extrato = ""
+extrato: list[str] = []
 numero_saques = 0
 LIMITE_SAQUES = 3
 
@@ -71,12 +75,12 @@ while True:
     if opcao == "d":
         valor = float(input("Informe o valor do depósito: "))
         # Atualiza as variáveis globais com o retorno da função
-        saldo, extrato = depositar(saldo, extrato, valor)
+        saldo = depositar(saldo, extrato, valor)
         
     elif opcao == "s":
         valor = float(input("Informe o valor do saque: "))
         # Atualiza as variáveis globais com o retorno da função
-        saldo, extrato, numero_saques = sacar(
+        saldo, numero_saques = sacar(
             saldo=saldo,
             extrato=extrato,
             numero_saques=numero_saques,
@@ -1,58 +1,102 @@
+import sys
 import textwrap
-from abc import ABC, abstractmethod, abstractproperty
+import time
+from collections import namedtuple
+from abc import ABC, abstractmethod
 from datetime import datetime, date
-from typing import List, Optional
+from typing import Dict, List, Optional
 from functools import wraps
 
+_MENU = textwrap.dedent("""\
+    ================ MENU ================
+    [d]\tDepositar
+    [s]\tSacar
+    [e]\tExtrato
+    [nc]\tNova conta
+    [lc]\tListar contas
+    [nu]\tNovo usuário
+    [q]\tSair
+    => """)
+
+_CPF_STRIP = str.maketrans("", "", ".-")
+
+_LINHAS_POR_ESCRITA = 64
+
+RegistroTransacao = namedtuple("RegistroTransacao", ["tipo", "valor", "data"])
+
 class Historico:
-    """Armazena o histórico de transações da conta."""
+    """Armazena o histórico de transações da conta em colunas paralelas."""
+    __slots__ = ("_tipos", "_valores", "_datas", "_cache_data", "_cache_lista")
+
     def __init__(self):
-        self._transacoes: List[dict] = []
+        self._tipos: List[str] = []
+        self._valores: List[float] = []
+        self._datas: List[datetime] = []
+        # Cache das transações do dia, válido enquanto a data não muda.
+        self._cache_data: Optional[date] = None
+        self._cache_lista: List[RegistroTransacao] = []
 
     @property
-    def transacoes(self) -> List[dict]:
-        return self._transacoes
+    def transacoes(self) -> List[RegistroTransacao]:
+        return list(self.gerar_relatorio())
 
     def adicionar_transacao(self, transacao):
         """Adiciona uma transação ao histórico."""
-        self._transacoes.append(
-            {
-                "tipo": transacao.__class__.__name__,
-                "valor": transacao.valor,
-                "data": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
-            }
-        )
+        tipo = transacao.__class__.__name__
+        valor = transacao.valor
+        data = datetime.now()
+        self._tipos.append(tipo)
+        self._valores.append(valor)
+        self._datas.append(data)
+
+        if data.date() == self._cache_data:
+            self._cache_lista.append(RegistroTransacao(tipo, valor, data))
 
     def gerar_relatorio(self, tipo_transacao: Optional[str] = None):
         """Gera um relatório (lazy) das transações usando um gerador."""
-        for transacao in self._transacoes:
-            if (
-                tipo_transacao is None
-                or transacao["tipo"].lower() == tipo_transacao.lower()
-            ):
-                yield transacao
-
-    def transacoes_do_dia(self) -> List[dict]:
+        alvo = tipo_transacao.lower() if tipo_transacao else None
+        for tipo, valor, data in zip(self._tipos, self._valores, self._datas):
+            if alvo is None or tipo.lower() == alvo:
+                yield RegistroTransacao(tipo, valor, data)
+
+    def total(self, tipo_transacao: Optional[str] = None) -> float:
+        """Soma os valores das transações, opcionalmente filtrando pelo tipo."""
+        if tipo_transacao is None:
+            return sum(self._valores)
+
+        alvo = tipo_transacao.lower()
+        return sum(
+            valor for tipo, valor in zip(self._tipos, self._valores)
+            if tipo.lower() == alvo
+        )
+
+    def _atualizar_cache_do_dia(self) -> List[RegistroTransacao]:
+        """Reconstrói o cache das transações do dia quando a data muda."""
+        hoje = date.today()
+        if self._cache_data != hoje:
+            self._cache_lista = [
+                RegistroTransacao(tipo, valor, data)
+                for tipo, valor, data in zip(self._tipos, self._valores, self._datas)
+                if data.date() == hoje
+            ]
+            self._cache_data = hoje
+        return self._cache_lista
+
+    def transacoes_do_dia(self) -> List[RegistroTransacao]:
         """Retorna todas as transações realizadas no dia de hoje."""
-        data_atual = datetime.now().date()
-        transacoes_do_dia = []
-        for transacao in self._transacoes:
-            try:
-                data_transacao = datetime.strptime(
-                    transacao["data"], "%d-%m-%Y %H:%M:%S"
-                ).date()
-                if data_atual == data_transacao:
-                    transacoes_do_dia.append(transacao)
-            except ValueError:
-                continue
-        return transacoes_do_dia
+        return list(self._atualizar_cache_do_dia())
+
+    def quantidade_do_dia(self) -> int:
+        """Retorna quantas transações foram realizadas no dia de hoje."""
+        return len(self._atualizar_cache_do_dia())
 
 
 class Transacao(ABC):
     """Classe base abstrata para todas as transações."""
+    __slots__ = ()
     
     @property
-    @abstractproperty
+    @abstractmethod
     def valor(self):
         """Retorna o valor da transação."""
         raise NotImplementedError
@@ -63,6 +107,8 @@ class Transacao(ABC):
         raise NotImplementedError
 
 class Saque(Transacao):
+    __slots__ = ("_valor",)
+
     def __init__(self, valor: float):
         self._valor = valor
 
@@ -80,6 +126,8 @@ class Saque(Transacao):
         return sucesso_transacao
 
 class Deposito(Transacao):
+    __slots__ = ("_valor",)
+
     def __init__(self, valor: float):
         self._valor = valor
 
@@ -98,6 +146,7 @@ class Deposito(Transacao):
 
 class Conta:
     """Classe base para contas bancárias."""
+    __slots__ = ("_saldo", "_numero", "_cliente", "_historico")
     AGENCIA = "0001"
 
     def __init__(self, numero: int, cliente):
@@ -157,10 +206,14 @@ class Conta:
 
 class ContaCorrente(Conta):
     """Conta corrente com limites de saque e valor."""
+    __slots__ = ("_limite", "_limite_saques", "_saques_dia_data", "_saques_dia_count")
+
     def __init__(self, numero: int, cliente, limite: float = 500.0, limite_saques: int = 3):
         super().__init__(numero, cliente)
         self._limite: float = limite
         self._limite_saques: int = limite_saques
+        self._saques_dia_data: Optional[date] = None
+        self._saques_dia_count: int = 0
 
     @classmethod
     def nova_conta(cls, cliente, numero: int, limite: float, limite_saques: int):
@@ -170,20 +223,25 @@ class ContaCorrente(Conta):
     def sacar(self, valor: float) -> bool:
         """Sobrescreve o sacar para aplicar limites da Conta Corrente."""
         
-        saques_do_dia = [
-            t for t in self.historico.transacoes_do_dia() if t["tipo"] == Saque.__name__
-        ]
-        numero_saques = len(saques_do_dia)
+        # Contador de saques do dia, zerado quando a data muda.
+        hoje = date.today()
+        if self._saques_dia_data != hoje:
+            self._saques_dia_data = hoje
+            self._saques_dia_count = 0
 
         if valor > self._limite:
             print("\n@@@ Operação falhou! O valor do saque excede o limite. @@@")
             return False
 
-        if numero_saques >= self._limite_saques:
+        if self._saques_dia_count >= self._limite_saques:
             print("\n@@@ Operação falhou! Número máximo de saques excedido. @@@")
             return False
 
-        return super().sacar(valor)
+        if not super().sacar(valor):
+            return False
+
+        self._saques_dia_count += 1
+        return True
 
     def __str__(self):
         """Representação de string da Conta Corrente."""
@@ -196,13 +254,15 @@ class ContaCorrente(Conta):
 
 class Cliente:
     """Classe base para clientes do banco."""
+    __slots__ = ("endereco", "contas")
+
     def __init__(self, endereco: str):
         self.endereco: str = endereco
         self.contas: List[Conta] = []
 
     def realizar_transacao(self, conta, transacao: Transacao) -> bool:
         """Realiza uma transação, verificando limites diários."""
-        if len(conta.historico.transacoes_do_dia()) >= 2:
+        if conta.historico.quantidade_do_dia() >= 2:
             print("\n@@@ Você excedeu o número de transações permitidas para hoje! @@@")
             return False
 
@@ -214,6 +274,8 @@ class Cliente:
 
 class PessoaFisica(Cliente):
     """Representa um cliente pessoa física."""
+    __slots__ = ("nome", "data_nascimento", "_cpf")
+
     def __init__(self, nome: str, data_nascimento: str, cpf: str, endereco: str):
         super().__init__(endereco)
         self.nome: str = nome
@@ -228,51 +290,36 @@ class PessoaFisica(Cliente):
         """Representação canônica do objeto."""
         return f"PessoaFisica(nome='{self.nome}', cpf='{self.cpf}', endereco='{self.endereco}')"
 
-class ContasIterador:
-    """Implementação do protocolo Iterator para as contas."""
-    def __init__(self, contas: List[Conta]):
-        self.contas: List[Conta] = contas
-        self._index: int = 0
-
-    def __iter__(self):
-        return self
+def iterar_contas(contas: List[Conta]):
+    """Gera a representação formatada de cada conta (lazy)."""
+    return (str(conta) for conta in contas)
 
-    def __next__(self):
-        """Retorna o próximo item formatado ou levanta StopIteration."""
-        if self._index >= len(self.contas):
-            raise StopIteration
-
-        conta = self.contas[self._index]
-        self._index += 1
-        
-        return str(conta)
+def _agora_formatado() -> str:
+    """Retorna a data e hora locais formatadas para o log."""
+    return time.strftime("%Y-%m-%d %H:%M:%S")
 
 def log_transacao(func):
     """Decorador para logar a execução de funções de transação."""
+    nome = func.__name__.upper()
+
     @wraps(func)
     def envelope(*args, **kwargs):
         resultado = func(*args, **kwargs)
-        print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] LOG: {func.__name__.upper()} EXECUTADA.")
+        print(f"[{_agora_formatado()}] LOG: {nome} EXECUTADA.")
         return resultado
     return envelope
 
 def menu() -> str:
     """Exibe o menu e captura a opção do usuário."""
-    menu_str = """\
-    ================ MENU ================
-    [d]\tDepositar
-    [s]\tSacar
-    [e]\tExtrato
-    [nc]\tNova conta
-    [lc]\tListar contas
-    [nu]\tNovo usuário
-    [q]\tSair
-    => """
-    return input(textwrap.dedent(menu_str)).strip().lower()
+    return input(_MENU).strip().lower()
+
+def normalizar_cpf(cpf: str) -> str:
+    """Remove espaços, pontos e traços do CPF, deixando somente os números."""
+    return cpf.strip().translate(_CPF_STRIP)
 
-def filtrar_cliente(cpf: str, clientes: List[PessoaFisica]) -> Optional[PessoaFisica]:
-    """Busca um cliente pelo CPF. Otimizado com generator expression."""
-    return next((cliente for cliente in clientes if cliente.cpf == cpf), None)
+def filtrar_cliente(cpf: str, clientes: Dict[str, PessoaFisica]) -> Optional[PessoaFisica]:
+    """Busca um cliente pelo CPF (normalizado) em tempo constante."""
+    return clientes.get(cpf)
 
 def recuperar_conta_cliente(cliente: Cliente):
     """Recupera a primeira conta do cliente (FIXME: precisa de melhoria para escolher)."""
@@ -283,8 +330,8 @@ def recuperar_conta_cliente(cliente: Cliente):
     return cliente.contas[0]
 
 @log_transacao
-def depositar(clientes: List[PessoaFisica]):
-    cpf = input("Informe o CPF do cliente: ")
+def depositar(clientes: Dict[str, PessoaFisica]):
+    cpf = normalizar_cpf(input("Informe o CPF do cliente: "))
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
@@ -307,8 +354,8 @@ def depositar(clientes: List[PessoaFisica]):
         cliente.realizar_transacao(conta, transacao)
 
 @log_transacao
-def sacar(clientes: List[PessoaFisica]):
-    cpf = input("Informe o CPF do cliente: ")
+def sacar(clientes: Dict[str, PessoaFisica]):
+    cpf = normalizar_cpf(input("Informe o CPF do cliente: "))
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
@@ -331,8 +378,8 @@ def sacar(clientes: List[PessoaFisica]):
         cliente.realizar_transacao(conta, transacao)
 
 @log_transacao
-def exibir_extrato(clientes: List[PessoaFisica]):
-    cpf = input("Informe o CPF do cliente: ")
+def exibir_extrato(clientes: Dict[str, PessoaFisica]):
+    cpf = normalizar_cpf(input("Informe o CPF do cliente: "))
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
@@ -343,24 +390,27 @@ def exibir_extrato(clientes: List[PessoaFisica]):
     if not conta:
         return
 
-    print("\n================ EXTRATO ================")
+    # Acumula as linhas e escreve em blocos, evitando um print por linha.
+    buf = ["\n================ EXTRATO ================"]
     
-    transacoes_str = [
-        f"{t['data']}\n{t['tipo']}:\n\tR$ {t['valor']:.2f}"
-        for t in conta.historico.gerar_relatorio()
-    ]
+    vazio = True
+    for t in conta.historico.gerar_relatorio():
+        vazio = False
+        buf.append(f"{t.data:%d-%m-%Y %H:%M:%S}\n{t.tipo}:\n\tR$ {t.valor:.2f}")
+        if len(buf) >= _LINHAS_POR_ESCRITA:
+            sys.stdout.write("\n".join(buf) + "\n")
+            buf.clear()
 
-    if not transacoes_str:
-        print("Não foram realizadas movimentações.")
-    else:
-        print("\n".join(transacoes_str))
+    if vazio:
+        buf.append("Não foram realizadas movimentações.")
 
-    print(f"\nSaldo:\n\tR$ {conta.saldo:.2f}")
-    print("==========================================")
+    buf.append(f"\nSaldo:\n\tR$ {conta.saldo:.2f}")
+    buf.append("==========================================")
+    sys.stdout.write("\n".join(buf) + "\n")
 
 @log_transacao
-def criar_cliente(clientes: List[PessoaFisica]):
-    cpf = input("Informe o CPF (somente número): ").strip().replace(".", "").replace("-", "")
+def criar_cliente(clientes: Dict[str, PessoaFisica]):
+    cpf = normalizar_cpf(input("Informe o CPF (somente número): "))
     cliente = filtrar_cliente(cpf, clientes)
 
     if cliente:
@@ -377,12 +427,12 @@ def criar_cliente(clientes: List[PessoaFisica]):
         nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco
     )
 
-    clientes.append(cliente)
+    clientes[cpf] = cliente
     print("\n=== Cliente criado com sucesso! ===")
 
 @log_transacao
-def criar_conta(numero_conta: int, clientes: List[PessoaFisica], contas: List[ContaCorrente]):
-    cpf = input("Informe o CPF do cliente: ")
+def criar_conta(numero_conta: int, clientes: Dict[str, PessoaFisica], contas: List[ContaCorrente]):
+    cpf = normalizar_cpf(input("Informe o CPF do cliente: "))
     cliente = filtrar_cliente(cpf, clientes)
 
     if not cliente:
@@ -400,9 +450,9 @@ def criar_conta(numero_conta: int, clientes: List[PessoaFisica], contas: List[Co
 
 
 def listar_contas(contas: List[Conta]):
-    """Lista todas as contas formatadas usando o iterador."""
+    """Lista todas as contas formatadas usando o gerador."""
 
-    for conta_info in ContasIterador(contas):
+    for conta_info in iterar_contas(contas):
         print("=" * 100)
         print(conta_info)
     
@@ -412,7 +462,7 @@ def listar_contas(contas: List[Conta]):
 
 def main():
     """Função principal do sistema."""
-    clientes: List[PessoaFisica] = []
+    clientes: Dict[str, PessoaFisica] = {}
     contas: List[ContaCorrente] = []
     
     while True: